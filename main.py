@@ -1,12 +1,25 @@
 import os
-from fastapi import FastAPI, HTTPException
+import re
+import logging
+import multiprocessing
+import asyncio
+import hashlib
+import orjson
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from typing import List
+from fastapi.responses import ORJSONResponse
+from typing import List, Optional, Tuple, get_args
+from functools import lru_cache
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from io import BytesIO
 from datetime import datetime
+from xml.sax.saxutils import escape
+from bson import ObjectId
+from cachetools import LRUCache, TTLCache
 
-from database import db, create_document, get_documents
+from database import db, create_document, create_documents
 from schemas import (
     ProposalInput, Proposal, BenefitTier,
     Sponsor,
@@ -15,7 +28,9 @@ from schemas import (
     LogInteractionRequest, ScheduleFollowUpRequest
 )
 
-app = FastAPI(title="Sponsorship Manager API", version="1.0")
+logger = logging.getLogger(__name__)
+
+app = FastAPI(title="Sponsorship Manager API", version="1.0", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -25,17 +40,122 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+async def _build_indexes():
+    try:
+        # (status, updated_at) serves status filters and recency sorts alike
+        await db["sponsor"].create_index([("status", 1), ("updated_at", -1)])
+        await db["followup"].create_index([("due_date", 1)])
+        await db["interaction"].create_index("sponsor_id")
+    except Exception:
+        logger.exception("Failed to create MongoDB indexes")
+
+@app.on_event("startup")
+async def ensure_indexes():
+    if db is None:
+        return
+    # Built in the background so an unreachable database cannot block or abort
+    # startup; /test reports the outage instead.
+    app.state.index_build = asyncio.create_task(_build_indexes())
+
+def _new_pdf_pool() -> ProcessPoolExecutor:
+    # forkserver: forking this process would copy the event loop and Motor's
+    # background threads (and any locks they hold) into the workers
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("forkserver"),
+    )
+
+@app.on_event("startup")
+async def start_pdf_pool():
+    app.state.pdf_pool = _new_pdf_pool()
+
+@app.on_event("shutdown")
+async def stop_pdf_pool():
+    # Don't block the event loop waiting on workers
+    app.state.pdf_pool.shutdown(wait=False, cancel_futures=True)
+
+# Proposal snapshots are telemetry: requests enqueue them and a background
+# task writes them with insert_many, PROPOSAL_FLUSH_BATCH at a time or every
+# PROPOSAL_FLUSH_INTERVAL seconds, whichever comes first.
+PROPOSAL_FLUSH_BATCH = 200
+PROPOSAL_FLUSH_INTERVAL = 0.05
+# Bounds memory when Mongo is slow or unreachable; overflow snapshots are dropped
+PROPOSAL_QUEUE_MAXSIZE = 10_000
+# Upper bound on how long shutdown waits for queued snapshots to be written
+PROPOSAL_DRAIN_TIMEOUT = 10.0
+
+async def _insert_proposals(batch: list):
+    try:
+        await create_documents("proposal", batch)
+    except Exception:
+        logger.exception("Failed to persist %d proposal snapshots", len(batch))
+
+async def _flush_proposals(queue: asyncio.Queue):
+    loop = asyncio.get_running_loop()
+    stopping = False
+    while not stopping:
+        item = await queue.get()
+        if item is None:
+            break
+        batch = [item]
+        deadline = loop.time() + PROPOSAL_FLUSH_INTERVAL
+        while len(batch) < PROPOSAL_FLUSH_BATCH:
+            try:
+                item = await asyncio.wait_for(queue.get(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+        try:
+            await _insert_proposals(batch)
+        except asyncio.CancelledError:
+            logger.warning("Dropped %d in-flight proposal snapshots", len(batch))
+            raise
+
+@app.on_event("startup")
+async def start_proposal_flusher():
+    app.state.proposal_q = asyncio.Queue(maxsize=PROPOSAL_QUEUE_MAXSIZE)
+    app.state.proposal_flusher = asyncio.create_task(_flush_proposals(app.state.proposal_q))
+
+@app.on_event("shutdown")
+async def stop_proposal_flusher():
+    queue = app.state.proposal_q
+
+    async def drain():
+        # None is the stop sentinel: everything queued before it is flushed first
+        await queue.put(None)
+        await app.state.proposal_flusher
+
+    try:
+        await asyncio.wait_for(drain(), PROPOSAL_DRAIN_TIMEOUT)
+    except asyncio.TimeoutError:
+        # wait_for cancelled the flusher; whatever is still queued is lost
+        dropped = sum(1 for _ in range(queue.qsize()) if queue.get_nowait() is not None)
+        logger.warning("Proposal snapshot drain timed out; dropped %d queued snapshots", dropped)
+
 # -------------------- Utility generators --------------------
 
+# Keyed on client-supplied demographics and channels of any length, so up to
+# 1024 entries of request text (and the summaries built from it) stay resident
+# until evicted. This is intentional: repeat inputs are the common case and the
+# entry cap bounds how many large inputs can be held at once.
+@lru_cache(maxsize=1024)
+def _summary_cached(audience_size: Optional[int], demographics: Optional[str], channels: Tuple[str, ...]) -> str:
+    size = f"~{audience_size:,} attendees" if audience_size else "audience aligned to your niche"
+    demo = demographics or "Mixed age groups with strong local presence"
+    channel_text = ", ".join(channels) if channels else "email, social, on-site activations"
+    return f"Projected reach {size}. Demographics: {demo}. Engagement via {channel_text}."
+
 def synthesize_audience_summary(inp: ProposalInput) -> str:
-    size = f"~{inp.audience_size:,} attendees" if inp.audience_size else "audience aligned to your niche"
-    demo = inp.demographics or "Mixed age groups with strong local presence"
-    channels = ", ".join(inp.engagement_channels) if inp.engagement_channels else "email, social, on-site activations"
-    return f"Projected reach {size}. Demographics: {demo}. Engagement via {channels}."
-
-def default_tiers(inp: ProposalInput) -> List[BenefitTier]:
-    base_price = max(500, (inp.audience_size or 500) * 0.5)
-    return [
+    return _summary_cached(inp.audience_size, inp.demographics, tuple(inp.engagement_channels or ()))
+
+@lru_cache(maxsize=1024)
+def _tiers_cached(audience_size: Optional[int]) -> Tuple[BenefitTier, ...]:
+    # Tiers are shared between requests: treat the returned models as read-only
+    base_price = max(500, (audience_size or 500) * 0.5)
+    return (
         BenefitTier(name="Bronze", price=round(base_price, 2), benefits=[
             "Logo on website", "Social media mention", "2 event passes"
         ]),
@@ -45,87 +165,159 @@ def default_tiers(inp: ProposalInput) -> List[BenefitTier]:
         BenefitTier(name="Gold", price=round(base_price * 3.5, 2), benefits=[
             "Prime logo placement", "Newsletter feature", "Stage shoutout", "6 event passes", "Lead capture access"
         ]),
-    ]
+    )
+
+def default_tiers(inp: ProposalInput) -> Tuple[BenefitTier, ...]:
+    return _tiers_cached(inp.audience_size)
+
+VALUE_POINTS = (
+    "Direct access to target local audiences",
+    "Brand visibility across digital and on-site touchpoints",
+    "Measurable engagement and post-event reporting",
+    "Long-term partnership opportunities",
+)
 
 def value_points(inp: ProposalInput) -> List[str]:
-    return [
-        "Direct access to target local audiences",
-        "Brand visibility across digital and on-site touchpoints",
-        "Measurable engagement and post-event reporting",
-        "Long-term partnership opportunities",
-    ]
+    return list(VALUE_POINTS)
 
 # -------------------- Proposal Builder --------------------
 
 @app.post("/api/proposals/generate", response_model=Proposal)
-def generate_proposal(inp: ProposalInput):
-    proposal = Proposal(
+async def generate_proposal(inp: ProposalInput):
+    # Every field is copied from validated input or built by our own helpers,
+    # so skip re-validation.
+    proposal = Proposal.model_construct(
         title=inp.title,
         description=inp.description,
         date=inp.date,
         location=inp.location,
         audience_summary=synthesize_audience_summary(inp),
         value_proposition=value_points(inp),
-        tiers=default_tiers(inp),
+        tiers=list(default_tiers(inp)),
         objectives=inp.objectives or [],
     )
-    # Persist snapshot for tracking
-    create_document("proposal", proposal.model_dump())
+    # Persist snapshot for tracking; written in batches off the request path
+    if db is not None:
+        try:
+            app.state.proposal_q.put_nowait(proposal.model_dump())
+        except asyncio.QueueFull:
+            logger.warning("Proposal snapshot queue full; dropping snapshot")
     return proposal
 
-@app.post("/api/proposals/export/pdf")
-def export_proposal_pdf(inp: ProposalInput):
-    # Lazy import to avoid hard dependency on startup
-    from reportlab.lib.pagesizes import LETTER
-    from reportlab.pdfgen import canvas
+# reportlab objects, bound on first render (see _render_proposal_pdf)
+_LETTER = None
+_SimpleDocTemplate = None
+_Paragraph = None
+_Spacer = None
+_STYLES = None
+
+# Rendered PDFs are cached by a digest of their full visible content, so
+# exporting the same proposal again returns the stored bytes without touching
+# reportlab. Keys hold no raw client text and the cache is bounded by total
+# PDF bytes rather than entry count.
+PDF_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_pdf_cache = LRUCache(maxsize=PDF_CACHE_MAX_BYTES, getsizeof=len)
+
+# Runs in the PDF process pool: keep it a top-level function of picklable args
+def _render_proposal_pdf(
+    title: str,
+    description: str,
+    date: Optional[str],
+    location: Optional[str],
+    audience_summary: str,
+    value_proposition: Tuple[str, ...],
+    tiers: Tuple[Tuple[str, float, Tuple[str, ...]], ...],
+) -> bytes:
+    # Lazy import to avoid hard dependency on startup; bound to module globals
+    # so later renders skip the import machinery entirely.
+    global _LETTER, _SimpleDocTemplate, _Paragraph, _Spacer, _STYLES
+    if _SimpleDocTemplate is None:
+        from reportlab.lib.pagesizes import LETTER as _LETTER
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.platypus import SimpleDocTemplate as _SimpleDocTemplate
+        from reportlab.platypus import Paragraph as _Paragraph, Spacer as _Spacer
+        _STYLES = getSampleStyleSheet()
+
+    h1, h2, body, bullet = _STYLES["Heading1"], _STYLES["Heading2"], _STYLES["Normal"], _STYLES["Bullet"]
+
+    def para(text, style=body):
+        # Paragraph parses markup: escape user text and keep explicit line breaks
+        return _Paragraph(escape(text).replace("\n", "<br/>"), style)
+
+    story = [
+        para(title, h1),
+        para(description),
+        para(f"Date: {date or 'TBD'}"),
+        para(f"Location: {location or 'TBD'}"),
+        _Spacer(1, 12),
+        para("Audience Summary:", h2),
+        para(audience_summary),
+        _Spacer(1, 12),
+        para("Value Proposition:", h2),
+        *[para(f"- {vp}") for vp in value_proposition],
+        _Spacer(1, 12),
+        para("Tiers:", h2),
+    ]
+    for name, price, benefits in tiers:
+        story.append(para(f"{name} - ${price:,.2f}"))
+        story.extend(para(f"• {b}", bullet) for b in benefits)
+        story.append(_Spacer(1, 12))
 
-    proposal = Proposal(
+    buffer = BytesIO()
+    doc = _SimpleDocTemplate(
+        buffer, pagesize=_LETTER,
+        leftMargin=50, rightMargin=50, topMargin=50, bottomMargin=50,
+    )
+    doc.build(story)
+    return buffer.getvalue()
+
+@app.post("/api/proposals/export/pdf")
+async def export_proposal_pdf(inp: ProposalInput):
+    # Every field is copied from validated input or built by our own helpers,
+    # so skip re-validation.
+    proposal = Proposal.model_construct(
         title=inp.title,
         description=inp.description,
         date=inp.date,
         location=inp.location,
         audience_summary=synthesize_audience_summary(inp),
         value_proposition=value_points(inp),
-        tiers=default_tiers(inp),
+        tiers=list(default_tiers(inp)),
         objectives=inp.objectives or [],
     )
 
-    buffer = BytesIO()
-    c = canvas.Canvas(buffer, pagesize=LETTER)
-    width, height = LETTER
-    y = height - 50
-
-    def write(text, size=12, leading=16):
-        nonlocal y
-        c.setFont("Helvetica", size)
-        for line in text.split("\n"):
-            c.drawString(50, y, line)
-            y -= leading
-
-    write(proposal.title, size=18, leading=22)
-    write(proposal.description)
-    write(f"Date: {proposal.date or 'TBD'}")
-    write(f"Location: {proposal.location or 'TBD'}")
-    write(" ")
-    write("Audience Summary:")
-    write(proposal.audience_summary)
-    write(" ")
-    write("Value Proposition:")
-    for vp in proposal.value_proposition:
-        write(f"- {vp}")
-    write(" ")
-    write("Tiers:")
-    for tier in proposal.tiers:
-        write(f"{tier.name} - ${tier.price:,.2f}")
-        for b in tier.benefits:
-            write(f"  • {b}")
-        write(" ")
-
-    c.showPage()
-    c.save()
-    buffer.seek(0)
-
-    return StreamingResponse(buffer, media_type="application/pdf", headers={
+    args = (
+        proposal.title,
+        proposal.description,
+        proposal.date,
+        proposal.location,
+        proposal.audience_summary,
+        tuple(proposal.value_proposition),
+        tuple((t.name, t.price, tuple(t.benefits)) for t in proposal.tiers),
+    )
+    key = hashlib.blake2b(orjson.dumps(args), digest_size=16).digest()
+    pdf_bytes = _pdf_cache.get(key)
+    if pdf_bytes is None:
+        # reportlab is CPU-bound: render in a worker process so the event loop
+        # and the GIL stay free for other requests.
+        loop = asyncio.get_running_loop()
+        pool = app.state.pdf_pool
+        try:
+            pdf_bytes = await loop.run_in_executor(pool, _render_proposal_pdf, *args)
+        except BrokenProcessPool:
+            # A dead worker (OOM kill, crash) breaks the pool for good: swap in
+            # a fresh one, unless a concurrent request already did, and retry once.
+            if app.state.pdf_pool is pool:
+                logger.warning("PDF process pool broken; restarting it")
+                app.state.pdf_pool = _new_pdf_pool()
+                pool.shutdown(wait=False, cancel_futures=True)
+            pdf_bytes = await loop.run_in_executor(app.state.pdf_pool, _render_proposal_pdf, *args)
+        # LRUCache rejects single values larger than its whole budget
+        if len(pdf_bytes) <= PDF_CACHE_MAX_BYTES:
+            _pdf_cache[key] = pdf_bytes
+
+    # The rendered PDF is already fully in memory: send it as one body
+    return Response(pdf_bytes, media_type="application/pdf", headers={
         "Content-Disposition": f"attachment; filename=proposal_{proposal.title.replace(' ', '_')}.pdf"
     })
 
@@ -139,103 +331,175 @@ SEED_BUSINESSES = [
     {"name": "River Bank Credit", "industry": "Finance", "website": "https://riverbank.example"},
 ]
 
+# Sponsor payloads and an industry index are derived once at import time;
+# requests only pick matching rows and stamp in the location.
+_SEED_PREBUILT = [
+    {
+        "name": b["name"],
+        "industry": b["industry"],
+        "email": f"info@{b['name'].replace(' ', '').lower()}.com",
+        "phone": "(555) 123-4567",
+        "website": b["website"],
+    }
+    for b in SEED_BUSINESSES
+]
+
+_BY_INDUSTRY = defaultdict(list)
+for _idx, _b in enumerate(SEED_BUSINESSES):
+    _BY_INDUSTRY[_b["industry"].lower()].append(_idx)
+
+@lru_cache(maxsize=1024)
+def _industry_matches(term_lc: str) -> frozenset:
+    """Seed indices whose industry contains the given lowercased term"""
+    return frozenset(
+        idx
+        for industry_lc, indices in _BY_INDUSTRY.items()
+        if term_lc in industry_lc
+        for idx in indices
+    )
+
+# Warm the cache with every word that appears in a seed industry, so common
+# queries resolve with a single dict lookup.
+for _industry_lc in _BY_INDUSTRY:
+    for _token in re.findall(r"\w+", _industry_lc):
+        _industry_matches(_token)
+
 @app.post("/api/sponsors/find", response_model=List[Sponsor])
 def find_sponsors(req: FindSponsorsRequest):
-    matches = []
-    for b in SEED_BUSINESSES:
-        if not req.industries or any(i.lower() in b["industry"].lower() for i in req.industries):
-            matches.append(Sponsor(
-                name=b["name"],
-                industry=b["industry"],
-                location=req.location,
-                email=f"info@{b['name'].replace(' ', '').lower()}.com",
-                phone="(555) 123-4567",
-                website=b["website"],
-            ))
-    return matches[: req.limit]
+    if req.industries:
+        candidates = sorted(frozenset().union(*(_industry_matches(i.lower()) for i in req.industries)))
+    else:
+        candidates = range(len(_SEED_PREBUILT))
+    # Seed payloads are module constants and location is already validated
+    return [Sponsor.model_construct(**_SEED_PREBUILT[idx], location=req.location) for idx in candidates[: req.limit]]
 
 # -------------------- Tracking & CRM --------------------
 
+_OID_RE = re.compile(r"[0-9a-fA-F]{24}")
+
+def parse_oid(value: str) -> Optional[ObjectId]:
+    """Return an ObjectId for a 24-char hex string, or None if malformed"""
+    return ObjectId(value) if _OID_RE.fullmatch(value) else None
+
 @app.post("/api/sponsors/create")
-def create_sponsor(sponsor: Sponsor):
-    sponsor_id = create_document("sponsor", sponsor.model_dump())
+async def create_sponsor(sponsor: Sponsor):
+    sponsor_id = await create_document("sponsor", sponsor.model_dump())
     return {"id": sponsor_id}
 
+# Only the fields the Sponsor schema exposes, plus the bookkeeping timestamp
+SPONSOR_LIST_PROJECTION = {**{f: 1 for f in Sponsor.model_fields}, "updated_at": 1}
+
 @app.get("/api/sponsors")
-def list_sponsors(status: str | None = None):
-    filt = {"status": status} if status else {}
-    docs = get_documents("sponsor", filt, limit=100)
-    for d in docs:
-        d["_id"] = str(d["_id"])  # jsonify
-    return docs
+async def list_sponsors(status: str | None = None):
+    if db is None:
+        raise HTTPException(status_code=500, detail="Database not configured")
+    # With a status filter, $match then $sort lets the planner pick the
+    # (status, updated_at) index, so MongoDB never sorts in memory.
+    pipeline = ([{"$match": {"status": status}}, {"$sort": {"updated_at": -1}}] if status else []) + [
+        {"$limit": 100},
+        {"$project": SPONSOR_LIST_PROJECTION},
+        {"$addFields": {"_id": {"$toString": "$_id"}}},
+    ]
+    cursor = db["sponsor"].aggregate(pipeline, batchSize=100)
+    return [d async for d in cursor]
 
 @app.post("/api/sponsors/status")
-def update_status(req: UpdateStatusRequest):
+async def update_status(req: UpdateStatusRequest):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not configured")
-    from bson import ObjectId
-    try:
-        oid = ObjectId(req.sponsor_id)
-    except Exception:
+    oid = parse_oid(req.sponsor_id)
+    if oid is None:
         raise HTTPException(status_code=400, detail="Invalid sponsor id")
-    db["sponsor"].update_one({"_id": oid}, {"$set": {"status": req.status, "updated_at": datetime.utcnow()}})
+    await db["sponsor"].update_one({"_id": oid}, {"$set": {"status": req.status, "updated_at": datetime.utcnow()}})
+    invalidate_email_cache(str(oid))
     return {"ok": True}
 
 @app.post("/api/sponsors/note")
-def add_note(req: AddNoteRequest):
-    from bson import ObjectId
-    try:
-        oid = ObjectId(req.sponsor_id)
-    except Exception:
+async def add_note(req: AddNoteRequest):
+    oid = parse_oid(req.sponsor_id)
+    if oid is None:
         raise HTTPException(status_code=400, detail="Invalid sponsor id")
-    db["sponsor"].update_one({"_id": oid}, {"$set": {"notes": req.note, "updated_at": datetime.utcnow()}})
+    await db["sponsor"].update_one({"_id": oid}, {"$set": {"notes": req.note, "updated_at": datetime.utcnow()}})
+    invalidate_email_cache(str(oid))
     return {"ok": True}
 
 @app.post("/api/sponsors/interaction")
-def log_interaction(req: LogInteractionRequest):
-    _id = create_document("interaction", req.model_dump())
+async def log_interaction(req: LogInteractionRequest):
+    _id = await create_document("interaction", req.model_dump())
     return {"id": _id}
 
 @app.post("/api/sponsors/followup")
-def schedule_followup(req: ScheduleFollowUpRequest):
-    _id = create_document("followup", req.model_dump())
+async def schedule_followup(req: ScheduleFollowUpRequest):
+    _id = await create_document("followup", req.model_dump())
     return {"id": _id}
 
 @app.get("/api/dashboard")
-def dashboard_overview():
+async def dashboard_overview():
     statuses = ["new", "contacted", "in_discussion", "pending", "confirmed", "declined"]
-    overview = {}
-    for s in statuses:
-        overview[s] = db["sponsor"].count_documents({"status": s}) if db else 0
-    upcoming = list(db["followup"].find({}).sort("due_date", 1).limit(5)) if db else []
+    if db is None:
+        return {"counts": {s: 0 for s in statuses}, "upcoming_followups": []}
+    # Status counts and the next followups come back from a single round-trip:
+    # the followup rows are appended to the $group output via $unionWith and
+    # tagged so they can be told apart from the count rows.
+    pipeline = [
+        {"$match": {"status": {"$in": statuses}}},
+        {"$group": {"_id": "$status", "n": {"$sum": 1}}},
+        {"$unionWith": {"coll": "followup", "pipeline": [
+            {"$sort": {"due_date": 1}},
+            {"$limit": 5},
+            {"$addFields": {"_upcoming": True}},
+        ]}},
+    ]
+    overview = {s: 0 for s in statuses}
+    upcoming = []
+    # At most one row per status plus the five followups: fetch in one batch
+    async for doc in db["sponsor"].aggregate(pipeline, batchSize=len(statuses) + 5):
+        if doc.pop("_upcoming", False):
+            upcoming.append(doc)
+        else:
+            overview[doc["_id"]] = doc["n"]
     for u in upcoming:
         u["_id"] = str(u["_id"]) if "_id" in u else None
     return {"counts": overview, "upcoming_followups": upcoming}
 
 # -------------------- Outreach Tools --------------------
 
+# Rendered emails keyed by (sponsor id, tone); short TTL bounds staleness
+_email_cache = TTLCache(maxsize=2048, ttl=60)
+EMAIL_TONES = get_args(GenerateEmailRequest.model_fields["tone"].annotation)
+
+def invalidate_email_cache(sponsor_id: str):
+    for tone in EMAIL_TONES:
+        _email_cache.pop((sponsor_id, tone), None)
+
 @app.post("/api/outreach/email")
-def generate_outreach_email(req: GenerateEmailRequest):
-    from bson import ObjectId
+async def generate_outreach_email(req: GenerateEmailRequest):
+    oid = parse_oid(req.sponsor_id)
+    # Only emails for existing sponsors are cached, so arbitrary client ids
+    # cannot evict real entries; the generic fallback is cheap to rebuild.
+    cache_key = (str(oid), req.tone) if oid is not None else None
+    if cache_key is not None:
+        cached = _email_cache.get(cache_key)
+        if cached is not None:
+            return cached
     sponsor = None
-    if db and req.sponsor_id:
-        try:
-            sponsor = db["sponsor"].find_one({"_id": ObjectId(req.sponsor_id)})
-        except Exception:
-            sponsor = None
+    if db is not None and oid is not None:
+        sponsor = await db["sponsor"].find_one({"_id": oid}, {"name": 1, "industry": 1})
     company = sponsor.get("name") if sponsor else "Partner"
     subject = f"Sponsorship Opportunity: {company} x Our Event"
+    salutation = company if company != "Partner" else "there"
+    focus = sponsor.get("industry") if sponsor else "your industry"
     body = (
-        "Hello "
-        + (company if company != "Partner" else "there")
-        + ",\n\n"
-        + "I'm reaching out to explore a potential sponsorship partnership. Based on your focus in "
-        + (sponsor.get("industry") if sponsor else "your industry")
-        + ", we believe there's strong alignment with our audience.\n\n"
-        + "Happy to send a tailored proposal and discuss options (Bronze, Silver, Gold) suited to your goals.\n\n"
-        + "Best regards,\nYour Name"
+        f"Hello {salutation},\n\n"
+        f"I'm reaching out to explore a potential sponsorship partnership. Based on your focus in {focus}, "
+        "we believe there's strong alignment with our audience.\n\n"
+        "Happy to send a tailored proposal and discuss options (Bronze, Silver, Gold) suited to your goals.\n\n"
+        "Best regards,\nYour Name"
     )
-    return {"subject": subject, "body": body}
+    email = {"subject": subject, "body": body}
+    if sponsor:
+        _email_cache[cache_key] = email
+    return email
 
 # -------------------- Health --------------------
 
@@ -244,7 +508,7 @@ def read_root():
     return {"message": "Sponsorship Manager API running"}
 
 @app.get("/test")
-def test_database():
+async def test_database():
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
@@ -260,7 +524,7 @@ def test_database():
             response["database_name"] = os.getenv("DATABASE_NAME") or "Unknown"
             response["connection_status"] = "Connected"
             try:
-                collections = db.list_collection_names()
+                collections = await db.list_collection_names()
                 response["collections"] = collections[:10]
                 response["database"] = "✅ Connected & Working"
             except Exception as e:
@@ -0,0 +1,126 @@
+import pytest
+from bson import ObjectId
+from fastapi.testclient import TestClient
+
+import main
+from main import app
+
+client = TestClient(app)
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def __aiter__(self):
+        for doc in self.docs:
+            yield doc
+
+
+class FakeCollection:
+    """Just enough of a Motor collection for the CRM endpoints"""
+
+    def __init__(self, docs=(), aggregate_rows=()):
+        self.docs = {d["_id"]: dict(d) for d in docs}
+        self.aggregate_rows = list(aggregate_rows)
+        self.find_one_calls = 0
+
+    async def find_one(self, filt, projection=None):
+        self.find_one_calls += 1
+        doc = self.docs.get(filt["_id"])
+        if doc is None:
+            return None
+        return {k: v for k, v in doc.items() if k == "_id" or not projection or k in projection}
+
+    async def update_one(self, filt, update):
+        self.docs[filt["_id"]].update(update["$set"])
+
+    def aggregate(self, pipeline, **kwargs):
+        return FakeCursor([dict(row) for row in self.aggregate_rows])
+
+
+class FakeDB(dict):
+    def __missing__(self, name):
+        self[name] = FakeCollection()
+        return self[name]
+
+
+SPONSOR_ID = ObjectId()
+
+
+@pytest.fixture
+def sponsors(monkeypatch):
+    collection = FakeCollection([{"_id": SPONSOR_ID, "name": "City Fitness", "industry": "Health & Wellness"}])
+    monkeypatch.setattr(main, "db", FakeDB(sponsor=collection))
+    main._email_cache.clear()
+    yield collection
+    main._email_cache.clear()
+
+
+def email(sponsor_id, tone="professional"):
+    resp = client.post("/api/outreach/email", json={"sponsor_id": sponsor_id, "tone": tone})
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def test_outreach_email_cached_per_sponsor_and_tone(sponsors):
+    first = email(str(SPONSOR_ID))
+    assert first["subject"] == "Sponsorship Opportunity: City Fitness x Our Event"
+    assert "focus in Health & Wellness" in first["body"]
+
+    # Upper-case hex normalizes to the same cache entry
+    assert email(str(SPONSOR_ID).upper()) == first
+    assert sponsors.find_one_calls == 1
+
+    email(str(SPONSOR_ID), tone="friendly")
+    assert sponsors.find_one_calls == 2
+
+
+@pytest.mark.parametrize("path,body", [
+    ("/api/sponsors/status", {"status": "contacted"}),
+    ("/api/sponsors/note", {"note": "Call back Friday"}),
+])
+def test_sponsor_updates_invalidate_outreach_email(sponsors, path, body):
+    email(str(SPONSOR_ID))
+    email(str(SPONSOR_ID), tone="concise")
+    assert sponsors.find_one_calls == 2
+
+    resp = client.post(path, json={"sponsor_id": str(SPONSOR_ID), **body})
+    assert resp.status_code == 200
+
+    email(str(SPONSOR_ID))
+    email(str(SPONSOR_ID), tone="concise")
+    assert sponsors.find_one_calls == 4
+
+
+def test_unknown_and_invalid_ids_are_not_cached(sponsors):
+    for _ in range(2):
+        unknown = email(str(ObjectId()))
+        invalid = email("not-an-object-id")
+    assert unknown == invalid
+    assert unknown["subject"] == "Sponsorship Opportunity: Partner x Our Event"
+    assert unknown["body"].startswith("Hello there,")
+    # Only the two unknown-id lookups reached Mongo; nothing was cached
+    assert sponsors.find_one_calls == 2
+    assert len(main._email_cache) == 0
+
+
+def test_dashboard_splits_counts_and_followups(monkeypatch):
+    followup_id = ObjectId()
+    rows = [
+        {"_id": "new", "n": 3},
+        {"_id": "confirmed", "n": 1},
+        {"_id": followup_id, "sponsor_id": str(SPONSOR_ID), "due_date": "2026-11-01", "_upcoming": True},
+    ]
+    monkeypatch.setattr(main, "db", FakeDB(sponsor=FakeCollection(aggregate_rows=rows)))
+
+    resp = client.get("/api/dashboard")
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["counts"] == {
+        "new": 3, "contacted": 0, "in_discussion": 0, "pending": 0, "confirmed": 1, "declined": 0,
+    }
+    assert data["upcoming_followups"] == [
+        {"_id": str(followup_id), "sponsor_id": str(SPONSOR_ID), "due_date": "2026-11-01"},
+    ]
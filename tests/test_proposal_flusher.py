@@ -0,0 +1,106 @@
+import asyncio
+import logging
+
+from fastapi.testclient import TestClient
+
+import main
+from main import app
+
+
+class FakeInserts:
+    """Stands in for create_documents, recording batch sizes"""
+
+    def __init__(self, fail_first=False, hang=False):
+        self.batches = []
+        self.fail_first = fail_first
+        self.hang = hang
+
+    async def __call__(self, collection_name, batch):
+        assert collection_name == "proposal"
+        if self.hang:
+            await asyncio.Event().wait()
+        if self.fail_first and not self.batches:
+            self.batches.append(None)
+            raise RuntimeError("insert failed")
+        self.batches.append(len(batch))
+
+
+def run_flusher(items, fake, monkeypatch, pause=0.0, more=()):
+    monkeypatch.setattr(main, "create_documents", fake)
+
+    async def scenario():
+        queue = asyncio.Queue()
+        task = asyncio.create_task(main._flush_proposals(queue))
+        for item in items:
+            queue.put_nowait(item)
+        await asyncio.sleep(pause)
+        for item in more:
+            queue.put_nowait(item)
+        queue.put_nowait(None)
+        await task
+
+    asyncio.run(scenario())
+    return fake.batches
+
+
+def test_flushes_full_batches_then_remainder_on_sentinel(monkeypatch):
+    batches = run_flusher([{"i": i} for i in range(450)], FakeInserts(), monkeypatch)
+    assert batches == [200, 200, 50]
+
+
+def test_flushes_partial_batch_after_deadline(monkeypatch):
+    # The first three items wait out the flush interval and go alone
+    batches = run_flusher(
+        [{"i": i} for i in range(3)], FakeInserts(), monkeypatch,
+        pause=main.PROPOSAL_FLUSH_INTERVAL * 4, more=[{"i": 3}],
+    )
+    assert batches == [3, 1]
+
+
+def test_survives_insert_failure(monkeypatch, caplog):
+    with caplog.at_level(logging.ERROR, logger="main"):
+        batches = run_flusher(
+            [{"i": 0}], FakeInserts(fail_first=True), monkeypatch,
+            pause=main.PROPOSAL_FLUSH_INTERVAL * 4, more=[{"i": 1}, {"i": 2}],
+        )
+    assert batches == [None, 2]
+    assert "Failed to persist 1 proposal snapshots" in caplog.text
+
+
+def test_shutdown_drain_is_bounded(monkeypatch, caplog):
+    monkeypatch.setattr(main, "create_documents", FakeInserts(hang=True))
+    monkeypatch.setattr(main, "PROPOSAL_DRAIN_TIMEOUT", 0.2)
+
+    async def scenario():
+        app.state.proposal_q = asyncio.Queue(maxsize=main.PROPOSAL_QUEUE_MAXSIZE)
+        app.state.proposal_flusher = asyncio.create_task(main._flush_proposals(app.state.proposal_q))
+        app.state.proposal_q.put_nowait({"i": 0})
+        # Let the flusher pick up the first item and block on its insert
+        await asyncio.sleep(main.PROPOSAL_FLUSH_INTERVAL * 4)
+        for i in range(1, 4):
+            app.state.proposal_q.put_nowait({"i": i})
+        await main.stop_proposal_flusher()
+        return app.state.proposal_flusher
+
+    with caplog.at_level(logging.WARNING, logger="main"):
+        task = asyncio.run(asyncio.wait_for(scenario(), 5))
+
+    assert task.cancelled()
+    assert "Dropped 1 in-flight proposal snapshots" in caplog.text
+    assert "dropped 3 queued snapshots" in caplog.text
+
+
+def test_generate_proposal_drops_snapshot_when_queue_full(monkeypatch, caplog):
+    monkeypatch.setattr(main, "db", object())
+    app.state.proposal_q = asyncio.Queue(maxsize=1)
+    app.state.proposal_q.put_nowait({"already": "queued"})
+
+    with caplog.at_level(logging.WARNING, logger="main"):
+        resp = TestClient(app).post(
+            "/api/proposals/generate", json={"title": "Full Queue", "description": "No room"}
+        )
+
+    assert resp.status_code == 200
+    assert resp.json()["title"] == "Full Queue"
+    assert app.state.proposal_q.qsize() == 1
+    assert "queue full; dropping snapshot" in caplog.text
@@ -0,0 +1,54 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from main import app
+
+
+def test_export_proposal_pdf():
+    payload = {
+        "title": "Spring Fun Run",
+        "description": "Community 5k with local vendors",
+        "audience_size": 1200,
+        "engagement_channels": ["email", "social"],
+    }
+    # Context manager runs the startup handlers (PDF process pool)
+    with TestClient(app) as client:
+        resp = client.post("/api/proposals/export/pdf", json=payload)
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/pdf"
+    assert "proposal_Spring_Fun_Run.pdf" in resp.headers["content-disposition"]
+    assert resp.content.startswith(b"%PDF")
+
+
+def test_export_proposal_pdf_recovers_from_broken_pool():
+    payload = {"title": "Broken Pool", "description": "Worker died before this export"}
+    with TestClient(app) as client:
+        broken = app.state.pdf_pool
+        # Kill a worker so the pool is permanently broken
+        with pytest.raises(BrokenProcessPool):
+            broken.submit(os._exit, 1).result()
+
+        resp = client.post("/api/proposals/export/pdf", json=payload)
+
+        assert app.state.pdf_pool is not broken
+    assert resp.status_code == 200
+    assert resp.content.startswith(b"%PDF")
+
+
+def test_export_proposal_pdf_cache_keyed_by_digest():
+    payload = {"title": "Cached Export", "description": "x" * 10_000}
+    main._pdf_cache.clear()
+    with TestClient(app) as client:
+        first = client.post("/api/proposals/export/pdf", json=payload)
+        second = client.post("/api/proposals/export/pdf", json=payload)
+
+    assert first.content == second.content
+    assert len(main._pdf_cache) == 1
+    # Keys are fixed-size digests, not the client's text; size is counted in bytes
+    assert [len(k) for k in main._pdf_cache] == [16]
+    assert main._pdf_cache.currsize == len(first.content)
@@ -0,0 +1,22 @@
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+def test_find_sponsors_matches_industry_substring():
+    payload = {"location": "Springfield", "industries": ["tech", "FIN"]}
+    resp = client.post("/api/sponsors/find", json=payload)
+
+    assert resp.status_code == 200
+    sponsors = resp.json()
+    assert [s["name"] for s in sponsors] == ["Tech Hub Co-Work", "River Bank Credit"]
+    assert {s["location"] for s in sponsors} == {"Springfield"}
+
+
+def test_find_sponsors_respects_limit():
+    resp = client.post("/api/sponsors/find", json={"location": "Springfield", "limit": 2})
+
+    assert resp.status_code == 200
+    assert [s["name"] for s in resp.json()] == ["City Fitness", "Brewed Awakenings"]